@@ -0,0 +1,377 @@
+import argparse
+import csv
+import json
+import os
+import random
+import re
+import struct
+import zipfile
+
+DEFAULT_FORMATS = ('xlsx', 'xlsb', 'docx', 'pptx', 'txt', 'zip')
+DEFAULT_KEYWORDS = ['keyword1', 'keyword2', 'keyword3', 'keyword4']
+
+# 本文の生成に使う語彙 (DEFAULT_KEYWORDS と部分一致しない単語のみ。任意のキーワードは
+# generate_corpus で検査する)
+VOCABULARY = [
+    'report', 'budget', 'quarter', 'sales', 'meeting', 'project', 'review',
+    'schedule', 'contract', 'invoice', 'customer', 'product', 'summary',
+    'analysis', 'forecast', 'target', 'status', 'update', 'approval', 'memo',
+    '売上', '予算', '会議', '報告', '顧客', '契約', '請求', '計画', '進捗', '承認',
+]
+
+# zip 内のタイムスタンプを固定し、同じ引数なら同じバイト列になるようにする
+FIXED_ZIP_DATE = (2024, 1, 1, 0, 0, 0)
+FIXED_CORE_DATE = '2024-01-01T00:00:00Z'
+CORE_DATE_PATTERN = re.compile(r'(<dcterms:(created|modified)\b[^>]*>)[^<]*(</dcterms:\2>)')
+
+# リーダーが本文以外に出力する文字列 (xlsx のシート見出し)
+READER_TEXT = ['Sheet Sheet1:']
+
+WORDS_PER_LINE = 12
+CELLS_PER_ROW = 8
+
+
+def generate_text(rng, size_bytes, keywords, keyword_density):
+    """
+    指定サイズ・キーワード密度の本文を決定的に生成する関数
+
+    Args:
+        rng (random.Random): 乱数生成器
+        size_bytes (int): 生成する本文のおおよそのサイズ (UTF-8 バイト数)
+        keywords (list): 埋め込むキーワードのリスト
+        keyword_density (float): 単語のうちキーワードに置き換える割合 (0.0〜1.0)
+
+    Returns:
+        tuple: (行のリスト, 埋め込まれたキーワードの集合)
+    """
+    lines = []
+    words = []
+    embedded = set()
+    total = 0
+    while total < size_bytes:
+        if keywords and rng.random() < keyword_density:
+            word = rng.choice(keywords)
+            embedded.add(word)
+        else:
+            word = rng.choice(VOCABULARY)
+        words.append(word)
+        total += len(word.encode('utf-8')) + 1
+        if len(words) >= WORDS_PER_LINE:
+            lines.append(' '.join(words))
+            words = []
+    if words:
+        lines.append(' '.join(words))
+    return lines, embedded
+
+
+def write_txt(file_path, lines):
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as file:
+        file.write('\n'.join(lines))
+
+
+def write_xlsx(file_path, lines):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    sheet = wb.create_sheet('Sheet1')
+    for line in lines:
+        words = line.split(' ')
+        for start in range(0, len(words), CELLS_PER_ROW):
+            sheet.append(words[start:start + CELLS_PER_ROW])
+    wb.save(file_path)
+    _normalize_ooxml(file_path)
+
+
+def write_docx(file_path, lines):
+    from docx import Document
+
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(file_path)
+    _normalize_ooxml(file_path)
+
+
+def write_pptx(file_path, lines, lines_per_slide=20):
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    presentation = Presentation()
+    layout = presentation.slide_layouts[6]  # 白紙レイアウト
+    for start in range(0, len(lines), lines_per_slide):
+        slide = presentation.slides.add_slide(layout)
+        textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(6.5))
+        textbox.text_frame.text = '\n'.join(lines[start:start + lines_per_slide])
+    presentation.save(file_path)
+    _normalize_ooxml(file_path)
+
+
+def _biff12_record(record_id, payload=b''):
+    # レコードIDはリトルエンディアンの1〜2バイト、長さは7ビット可変長で符号化する
+    if record_id < 0x80:
+        header = bytes([record_id])
+    else:
+        header = bytes([record_id & 0xFF, record_id >> 8])
+    length = len(payload)
+    while True:
+        byte = length & 0x7F
+        length >>= 7
+        if length:
+            header += bytes([byte | 0x80])
+        else:
+            header += bytes([byte])
+            break
+    return header + payload
+
+
+def _biff12_string(value):
+    return struct.pack('<I', len(value)) + value.encode('utf-16-le')
+
+
+def _write_zip_member(zip_ref, name, data):
+    info = zipfile.ZipInfo(name, date_time=FIXED_ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    zip_ref.writestr(info, data)
+
+
+def _normalize_ooxml(file_path):
+    # ライブラリが埋め込む保存日時 (zip エントリと docProps/core.xml) を固定値に置き換える
+    with zipfile.ZipFile(file_path, 'r') as zip_ref:
+        entries = [(info.filename, zip_ref.read(info)) for info in zip_ref.infolist()]
+    with zipfile.ZipFile(file_path, 'w') as zip_ref:
+        for name, data in entries:
+            if name == 'docProps/core.xml':
+                data = CORE_DATE_PATTERN.sub(
+                    lambda match: f"{match.group(1)}{FIXED_CORE_DATE}{match.group(3)}", data.decode('utf-8')
+                ).encode('utf-8')
+            _write_zip_member(zip_ref, name, data)
+
+
+def write_xlsb(file_path, lines):
+    """
+    共有文字列テーブルを使う最小構成の XLSB ファイルを書き出す関数
+
+    XLSB を書き出せるライブラリがないため、BIFF12 レコードを直接組み立てる。
+
+    Args:
+        file_path (str): 出力先のパス
+        lines (list): セルに分割して書き込む行のリスト
+    """
+    rows = []
+    for line in lines:
+        words = line.split(' ')
+        for start in range(0, len(words), CELLS_PER_ROW):
+            rows.append(words[start:start + CELLS_PER_ROW])
+
+    strings = []
+    string_index = {}
+    sheet_data = []
+    total_cells = 0
+    for row_number, row in enumerate(rows):
+        sheet_data.append(_biff12_record(0x0000, struct.pack('<I', row_number)))
+        for column, value in enumerate(row):
+            if value not in string_index:
+                string_index[value] = len(strings)
+                strings.append(value)
+            sheet_data.append(_biff12_record(
+                0x0007, struct.pack('<III', column, 0, string_index[value])
+            ))
+            total_cells += 1
+
+    last_row = max(len(rows) - 1, 0)
+    last_column = max(CELLS_PER_ROW - 1, 0)
+    sheet_bin = b''.join([
+        _biff12_record(0x0181),
+        _biff12_record(0x0194, struct.pack('<IIII', 0, last_row, 0, last_column)),
+        _biff12_record(0x0191),
+        *sheet_data,
+        _biff12_record(0x0192),
+        _biff12_record(0x0182),
+    ])
+    shared_strings_bin = b''.join([
+        _biff12_record(0x019F, struct.pack('<II', total_cells, len(strings))),
+        *(_biff12_record(0x0013, b'\x00' + _biff12_string(value)) for value in strings),
+        _biff12_record(0x01A0),
+    ])
+    workbook_bin = b''.join([
+        _biff12_record(0x0183),
+        _biff12_record(0x018F),
+        _biff12_record(0x019C, struct.pack('<II', 0, 1) + _biff12_string('rId1') + _biff12_string('Sheet1')),
+        _biff12_record(0x0190),
+        _biff12_record(0x0184),
+    ])
+
+    relationship = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="bin" ContentType="application/vnd.ms-excel.sheet.binary.macroEnabled.main"/>'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.bin" ContentType="application/vnd.ms-excel.worksheet"/>'
+        '<Override PartName="/xl/sharedStrings.bin" ContentType="application/vnd.ms-excel.sharedStrings"/>'
+        '</Types>'
+    )
+    root_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{relationship}/officeDocument" Target="xl/workbook.bin"/>'
+        '</Relationships>'
+    )
+    workbook_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{relationship}/worksheet" Target="worksheets/sheet1.bin"/>'
+        f'<Relationship Id="rId2" Type="{relationship}/sharedStrings" Target="sharedStrings.bin"/>'
+        '</Relationships>'
+    )
+
+    with zipfile.ZipFile(file_path, 'w') as zip_ref:
+        _write_zip_member(zip_ref, '[Content_Types].xml', content_types)
+        _write_zip_member(zip_ref, '_rels/.rels', root_rels)
+        _write_zip_member(zip_ref, 'xl/workbook.bin', workbook_bin)
+        _write_zip_member(zip_ref, 'xl/_rels/workbook.bin.rels', workbook_rels)
+        _write_zip_member(zip_ref, 'xl/worksheets/sheet1.bin', sheet_bin)
+        _write_zip_member(zip_ref, 'xl/sharedStrings.bin', shared_strings_bin)
+
+
+def validate_keywords(keywords):
+    """
+    生成した本文でキーワードが意図せず一致しないか検査する関数
+
+    search_keywords は部分一致で検索するため、キーワードが語彙の単語やリーダーの出力、
+    ほかのキーワードの一部に含まれていると、埋め込んでいない位置でも一致してしまう。
+
+    Args:
+        keywords (list): 検査するキーワードのリスト
+
+    Raises:
+        ValueError: 意図しない一致が起こりうるキーワードがある場合
+    """
+    for keyword in keywords:
+        if not keyword or any(character.isspace() for character in keyword):
+            raise ValueError(f"Keyword must be non-empty and contain no whitespace: {keyword!r}")
+        others = [other for other in keywords if other != keyword]
+        for text in VOCABULARY + READER_TEXT + others:
+            if keyword in text:
+                raise ValueError(f"Keyword {keyword!r} is part of {text!r} and would match text it was not embedded in")
+
+
+WRITERS = {
+    'txt': write_txt,
+    'xlsx': write_xlsx,
+    'xlsb': write_xlsb,
+    'docx': write_docx,
+    'pptx': write_pptx,
+}
+
+
+def write_zip(file_path, members, work_dir):
+    """
+    生成済みのファイルをまとめて ZIP ファイルを書き出す関数
+
+    Args:
+        file_path (str): 出力先のパス
+        members (list): (アーカイブ内の名前, 書き込む行のリスト) のリスト
+        work_dir (str): メンバーを一時的に書き出すディレクトリ
+    """
+    with zipfile.ZipFile(file_path, 'w') as zip_ref:
+        for member_name, lines in members:
+            member_path = os.path.join(work_dir, member_name)
+            extension = member_name.rsplit('.', 1)[-1]
+            WRITERS[extension](member_path, lines)
+            with open(member_path, 'rb') as member:
+                _write_zip_member(zip_ref, member_name, member.read())
+            os.remove(member_path)
+
+
+def generate_corpus(output_dir, formats=DEFAULT_FORMATS, files_per_format=5, size_kb=64,
+                    keyword_density=0.001, keywords=None, seed=0,
+                    zip_member_formats=('txt', 'docx')):
+    """
+    ベンチマーク用の合成コーパスを生成する関数
+
+    同じ引数であればすべての形式でバイト列まで同一になる (xlsx / docx / pptx は
+    ライブラリが埋め込む保存日時を固定値に置き換える)。キーワードが語彙やほかの
+    キーワードと部分一致すると、マニフェストと実際の検索結果が食い違うため拒否する。
+
+    Args:
+        output_dir (str): 出力先ディレクトリ
+        formats (tuple): 生成するファイル形式
+        files_per_format (int): 形式ごとのファイル数
+        size_kb (int): 1ファイルあたりの本文サイズ (KB)
+        keyword_density (float): 単語のうちキーワードに置き換える割合 (0.0〜1.0)
+        keywords (list): 埋め込むキーワードのリスト (省略時は DEFAULT_KEYWORDS)
+        seed (int): 乱数シード
+        zip_member_formats (tuple): ZIP ファイルに格納するファイル形式
+
+    Returns:
+        list: ファイルごとのマニフェスト (path, format, text_bytes, keywords) のリスト
+    """
+    if keywords is None:
+        keywords = DEFAULT_KEYWORDS
+    validate_keywords(keywords)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = []
+    for file_format in formats:
+        if file_format != 'zip' and file_format not in WRITERS:
+            raise ValueError(f"Unsupported corpus format: {file_format}")
+        for index in range(files_per_format):
+            # ファイルごとに独立した乱数列を使い、形式の組み合わせに結果が依存しないようにする
+            rng = random.Random(f"{seed}:{file_format}:{index}")
+            file_name = f"{file_format}_{index:04d}.{file_format}"
+            file_path = os.path.join(output_dir, file_name)
+
+            if file_format == 'zip':
+                members = []
+                embedded = set()
+                text_bytes = 0
+                member_size = size_kb * 1024 // max(len(zip_member_formats), 1)
+                for member_format in zip_member_formats:
+                    lines, member_keywords = generate_text(rng, member_size, keywords, keyword_density)
+                    members.append((f"member_{index:04d}.{member_format}", lines))
+                    embedded |= member_keywords
+                    text_bytes += sum(len(line.encode('utf-8')) + 1 for line in lines)
+                write_zip(file_path, members, output_dir)
+            else:
+                lines, embedded = generate_text(rng, size_kb * 1024, keywords, keyword_density)
+                text_bytes = sum(len(line.encode('utf-8')) + 1 for line in lines)
+                WRITERS[file_format](file_path, lines)
+
+            manifest.append({
+                'path': file_path,
+                'format': file_format,
+                'text_bytes': text_bytes,
+                'keywords': sorted(embedded),
+            })
+
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    # FileProcessor.process_csv にそのまま渡せるファイルリスト
+    with open(os.path.join(output_dir, 'file_list.csv'), 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        for entry in manifest:
+            writer.writerow([entry['path']])
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ベンチマーク用の合成コーパスを生成します')
+    parser.add_argument('output_dir')
+    parser.add_argument('--formats', nargs='+', default=list(DEFAULT_FORMATS), choices=DEFAULT_FORMATS)
+    parser.add_argument('--files-per-format', type=int, default=5)
+    parser.add_argument('--size-kb', type=int, default=64)
+    parser.add_argument('--density', type=float, default=0.001)
+    parser.add_argument('--keywords', nargs='+', default=DEFAULT_KEYWORDS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    manifest = generate_corpus(
+        args.output_dir, tuple(args.formats), args.files_per_format, args.size_kb,
+        args.density, args.keywords, args.seed
+    )
+    print(f"Generated {len(manifest)} files in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# リポジトリのルートから `python benchmarks/run_benchmarks.py` でも実行できるようにする
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus_generator import DEFAULT_FORMATS, DEFAULT_KEYWORDS, generate_corpus  # noqa: E402
+
+# これ未満のメモリ増加は誤差として扱う
+MEMORY_NOISE_BYTES = 64 * 1024
+MEMORY_REPEAT = 5
+# これ未満の繰り返し回数では比較結果で失敗させない
+MIN_GATING_REPEAT = 3
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def load_readers():
+    """
+    形式ごとのリーダー関数を読み込む関数
+
+    依存ライブラリが入っていない形式はスキップする。
+
+    Returns:
+        dict: ファイル形式をキー、リーダー関数を値とする辞書
+    """
+    readers = {}
+    candidates = {
+        'xlsx': ('src.file_readers.excel_reader', 'read_excel'),
+        'xlsb': ('src.file_readers.xlsb_reader', 'read_xlsb'),
+        'docx': ('src.file_readers.word_reader', 'read_word'),
+        'pptx': ('src.file_readers.powerpoint_reader', 'read_powerpoint'),
+        'txt': ('src.file_readers.text_reader', 'read_text'),
+        'zip': ('src.file_readers.zip_reader', 'read_zip'),
+    }
+    for file_format, (module_name, function_name) in candidates.items():
+        try:
+            module = __import__(module_name, fromlist=[function_name])
+            readers[file_format] = getattr(module, function_name)
+        except ImportError as e:
+            logging.warning(f"Skipping {file_format} reader: {e}")
+    return readers
+
+
+def measure(function, repeat, min_time=0.2):
+    """
+    関数の実行時間と Python ヒープのピーク使用量を計測する関数
+
+    数ミリ秒で終わる処理は誤差が大きいため、1回の計測が min_time 秒以上になるまで
+    関数をまとめて呼び出し、1呼び出しあたりの時間に換算する。
+    メモリは tracemalloc で計測するため、lxml などの C 拡張が確保する領域は含まれない。
+    tracemalloc は実行を遅くするため、時間計測とは別に計測する。
+
+    Args:
+        function (callable): 計測する引数なしの関数
+        repeat (int): 時間計測の繰り返し回数 (1 以上)
+        min_time (float): 1回の計測に費やす最小秒数
+
+    Returns:
+        dict: seconds (中央値), min_seconds (最小値), spread (最小値に対するばらつきの割合),
+            loops (1回の計測あたりの呼び出し回数), peak_memory_bytes (Python ヒープのピークの最小値),
+            memory_spread
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    loops = max(1, math.ceil(min_time / elapsed)) if elapsed > 0 else 1
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        timings.append((time.perf_counter() - start) / loops)
+
+    # ピーク使用量は GC やスレッドのタイミングで揺れるため、数回計測して最小値とばらつきを記録する
+    peaks = []
+    for _ in range(MEMORY_REPEAT):
+        tracemalloc.start()
+        try:
+            function()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'seconds': statistics.median(timings),
+        'min_seconds': min(timings),
+        'spread': (max(timings) - min(timings)) / min(timings) if min(timings) > 0 else 0.0,
+        'loops': loops,
+        'peak_memory_bytes': min(peaks),
+        'memory_spread': (max(peaks) - min(peaks)) / min(peaks) if min(peaks) > 0 else 0.0,
+    }
+
+
+def bench_readers(manifest, readers, repeat):
+    results = {}
+    for file_format, reader in readers.items():
+        entries = [entry for entry in manifest if entry['format'] == file_format]
+        if not entries:
+            continue
+        paths = [entry['path'] for entry in entries]
+        text_bytes = sum(entry['text_bytes'] for entry in entries)
+
+        def read_all(paths=paths, reader=reader):
+            for path in paths:
+                reader(path)
+
+        result = measure(read_all, repeat)
+        result['files_per_second'] = len(paths) / result['seconds']
+        result['mb_per_second'] = text_bytes / (1024 * 1024) / result['seconds']
+        results[f"reader.{file_format}"] = result
+    return results
+
+
+def bench_matcher(manifest, readers, keywords, repeat):
+    from src.file_processor import FileProcessor
+
+    processor = FileProcessor(keywords, [], None, float('inf'))
+    contents = []
+    for entry in manifest:
+        reader = readers.get(entry['format'])
+        if reader is None:
+            continue
+        content = reader(entry['path'])
+        if isinstance(content, dict):
+            contents.extend(content.values())
+        elif content:
+            contents.append(content)
+    text_bytes = sum(len(content.encode('utf-8')) for content in contents)
+
+    def match_all():
+        for content in contents:
+            processor.search_keywords(content)
+
+    result = measure(match_all, repeat)
+    result['mb_per_second'] = text_bytes / (1024 * 1024) / result['seconds']
+    return {'matcher': result}
+
+
+def bench_end_to_end(corpus_dir, manifest, keywords, repeat):
+    from src.file_processor import FileProcessor
+
+    processor = FileProcessor(keywords, [], None, float('inf'), show_progress=False)
+    file_list = os.path.join(corpus_dir, 'file_list.csv')
+
+    result = measure(lambda: processor.process_csv(file_list), repeat)
+    result['files_per_second'] = len(manifest) / result['seconds']
+    return {'end_to_end': result}
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    計測結果をベースラインと比較する関数
+
+    時間・メモリとも最小値同士で比較し、両方の計測のばらつきの合計が tolerance より
+    大きい場合はその合計を許容範囲とする。メモリは MEMORY_NOISE_BYTES 未満の増加を無視する。
+
+    Args:
+        results (dict): 今回の計測結果
+        baseline (dict): 保存済みのベースライン
+        tolerance (float): 許容する悪化率 (0.1 なら 10% まで)
+
+    Returns:
+        list: 許容範囲を超えて遅くなった、またはメモリが増えたベンチマーク名のリスト
+    """
+    if baseline.get('params') != results['params']:
+        logging.warning("Baseline was recorded with different corpus parameters; comparison may be meaningless")
+
+    regressions = []
+    print(f"{'benchmark':<16} {'baseline (s)':>13} {'current (s)':>12} {'time':>8}  "
+          f"{'base heap KiB':>13} {'heap KiB':>10} {'heap':>8}")
+    for name, current in sorted(results['benchmarks'].items()):
+        current_memory = current['peak_memory_bytes']
+        previous = baseline.get('benchmarks', {}).get(name)
+        if previous is None:
+            print(f"{name:<16} {'-':>13} {current['min_seconds']:>12.5f} {'new':>8}  "
+                  f"{'-':>13} {current_memory / 1024:>10.1f} {'new':>8}")
+            continue
+
+        previous_seconds = previous.get('min_seconds', previous['seconds'])
+        time_change = current['min_seconds'] / previous_seconds - 1
+        # 計測ごとのばらつきの合計までは誤差とみなす
+        time_threshold = max(tolerance, current.get('spread', 0.0) + previous.get('spread', 0.0))
+        time_regressed = time_change > time_threshold
+
+        previous_memory = previous['peak_memory_bytes']
+        memory_change = current_memory / previous_memory - 1 if previous_memory else 0.0
+        memory_threshold = max(tolerance, current.get('memory_spread', 0.0) + previous.get('memory_spread', 0.0))
+        memory_regressed = (memory_change > memory_threshold
+                            and current_memory - previous_memory > MEMORY_NOISE_BYTES)
+
+        print(f"{name:<16} {previous_seconds:>13.5f} {current['min_seconds']:>12.5f} "
+              f"{time_change:>+8.1%}{' !' if time_regressed else '  '}"
+              f"{previous_memory / 1024:>13.1f} {current_memory / 1024:>10.1f} "
+              f"{memory_change:>+8.1%}{' !' if memory_regressed else ''}")
+        if time_regressed or memory_regressed:
+            regressions.append(name)
+
+    # プロセス全体の最大 RSS は C 拡張の確保分も含むが、ベンチマークごとには分けられないため参考値とする
+    if results.get('max_rss_bytes') and baseline.get('max_rss_bytes'):
+        print(f"Process peak RSS (not gated): baseline {baseline['max_rss_bytes'] / 1024 / 1024:.1f} MiB, "
+              f"current {results['max_rss_bytes'] / 1024 / 1024:.1f} MiB")
+    return regressions
+
+
+def exit_status(regressions, repeat):
+    """
+    比較結果から終了ステータスを決める関数
+
+    Args:
+        regressions (list): compare_with_baseline が返したベンチマーク名のリスト
+        repeat (int): 時間計測の繰り返し回数
+
+    Returns:
+        int: 悪化があれば 1。ただし repeat が MIN_GATING_REPEAT 未満なら
+            ばらつきを見積もれないため 0
+    """
+    if not regressions:
+        return 0
+    if repeat < MIN_GATING_REPEAT:
+        return 0
+    return 1
+
+
+def max_rss_bytes():
+    # ru_maxrss は Linux では KiB、macOS ではバイト単位
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def run(corpus_dir, params, repeat):
+    manifest = generate_corpus(corpus_dir, **params)
+    keywords = params['keywords']
+    readers = load_readers()
+
+    benchmarks = {}
+    benchmarks.update(bench_readers(manifest, readers, repeat))
+    benchmarks.update(bench_matcher(manifest, readers, keywords, repeat))
+    benchmarks.update(bench_end_to_end(corpus_dir, manifest, keywords, repeat))
+
+    return {
+        'created': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {key: list(value) if isinstance(value, tuple) else value for key, value in params.items()},
+        'benchmarks': benchmarks,
+        'max_rss_bytes': max_rss_bytes(),
+    }
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ファイルリーダーとキーワード検索のベンチマークを実行します')
+    parser.add_argument('--corpus-dir', help='コーパスの出力先 (省略時は一時ディレクトリ)')
+    parser.add_argument('--formats', nargs='+', default=list(DEFAULT_FORMATS), choices=DEFAULT_FORMATS)
+    parser.add_argument('--files-per-format', type=int, default=5)
+    parser.add_argument('--size-kb', type=int, default=64)
+    parser.add_argument('--density', type=float, default=0.001)
+    parser.add_argument('--keywords', nargs='+', default=DEFAULT_KEYWORDS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=positive_int, default=5)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='今回の結果をベースラインとして保存する')
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    parser.add_argument('--output', help='結果を JSON で書き出すパス')
+    args = parser.parse_args()
+
+    # 処理ごとのログで計測結果が埋もれないようにする
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+    params = {
+        'formats': tuple(args.formats),
+        'files_per_format': args.files_per_format,
+        'size_kb': args.size_kb,
+        'keyword_density': args.density,
+        'keywords': args.keywords,
+        'seed': args.seed,
+    }
+
+    if args.corpus_dir:
+        results = run(args.corpus_dir, params, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            results = run(corpus_dir, params, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        for name, result in sorted(results['benchmarks'].items()):
+            print(f"{name:<16} {result['min_seconds']:>10.4f} s  heap peak {result['peak_memory_bytes'] / 1024:>10.1f} KiB")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressions over {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.repeat < MIN_GATING_REPEAT:
+            # 計測が少ないとばらつきを見積もれないため、結果は参考値として扱う
+            print(f"Not failing: --repeat {args.repeat} is too few to estimate noise (use at least {MIN_GATING_REPEAT})")
+    return exit_status(regressions, args.repeat)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,81 @@
+import argparse
+import glob
+import os
+import sys
 from src.file_processor import FileProcessor
+from src.file_readers.csv_reader import read_csv
 from src.utils.config_loader import load_config
 from src.utils.logger import setup_logger
+from src.utils.sharding import SHARD_STRATEGIES, merge_results, parse_shard
+
+MAX_REPORTED_MISSING = 20
 
 def validate_config(config):
     required_keys = ['keywords', 'file_paths', 'notifications', 'logging']
     return all(key in config for key in required_keys)
 
-def main():
+def shard_argument(value):
+    # argparse に ValueError のメッセージをそのまま表示させる
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='ファイル内のキーワードを検索します')
+    parser.add_argument('--shard', type=shard_argument, metavar='i/N',
+                        help='ファイルリストを N 分割し、i 番目 (1 始まり) のみ処理する')
+    parser.add_argument('--shard-strategy', choices=SHARD_STRATEGIES, default='size',
+                        help='分割方法 (size: ファイルサイズで均等化, hash: パスのハッシュ, range: 件数で連続分割)')
+    parser.add_argument('--merge', nargs='*', metavar='RESULT_CSV',
+                        help='シャードごとの結果 CSV をまとめる (省略時はログ出力先のシャード結果をすべて対象)')
+    parser.add_argument('--merge-output', metavar='CSV',
+                        help='まとめた結果の出力先 (省略時は <file_base>_results.csv)')
+    return parser.parse_args(argv)
+
+def merge(config, result_csv_paths, output_path):
+    file_base = config['logging']['file_base']
+    if not result_csv_paths:
+        result_csv_paths = sorted(glob.glob(f"{file_base}_shard*of*_results.csv"))
+    if not result_csv_paths:
+        print(f"No shard result files found: {file_base}_shard*of*_results.csv", file=sys.stderr)
+        return False
+
+    # 入力ファイルリストの順序で並べ、結果のないファイルを検出する
+    csv_path = config['file_paths']['csv']
+    file_paths = read_csv(csv_path) if os.path.exists(csv_path) else None
+    count, missing = merge_results(result_csv_paths, output_path or f"{file_base}_results.csv", file_paths)
+    print(f"Merged {len(result_csv_paths)} result files into {count} rows")
+    if missing:
+        print(f"{len(missing)} input files have no result (lost shard or mismatched partition):", file=sys.stderr)
+        for path in missing[:MAX_REPORTED_MISSING]:
+            print(f"  {path}", file=sys.stderr)
+        if len(missing) > MAX_REPORTED_MISSING:
+            print(f"  ... and {len(missing) - MAX_REPORTED_MISSING} more", file=sys.stderr)
+        return False
+    return True
+
+def main(argv=None):
+    args = parse_args(argv)
+
     # 設定の読み込みと検証
     config = load_config()
     if not validate_config(config):
         raise ValueError("設定ファイルが不完全です")
 
+    if args.merge is not None:
+        return 0 if merge(config, args.merge, args.merge_output) else 1
+
+    # シャードごとにログと結果 CSV を分け、複数プロセスが同じ出力先を使えるようにする
+    file_base = config['logging']['file_base']
+    if args.shard is not None:
+        file_base = f"{file_base}_shard{args.shard[0]}of{args.shard[1]}"
+
     # ロガーのセットアップ
     setup_logger(
         config['logging']['level'],
         config['logging']['format'],
-        config['logging']['file_base']
+        file_base
     )
 
     # FileProcessorのインスタンス化
@@ -24,11 +83,19 @@ def main():
         config['keywords']['A'],
         config['keywords']['B'],
         config['notifications']['webhook_url'],
-        config['notifications']['error_threshold']
+        config['notifications']['error_threshold'],
+        config['notifications'].get('flush_interval', 5.0),
+        config['notifications'].get('max_queue_size', 1000),
+        config['notifications'].get('max_retries', 3),
+        close_timeout=config['notifications'].get('close_timeout', 30)
     )
 
     # CSVファイルの処理
-    processor.process_csv(config['file_paths']['csv'])
+    try:
+        processor.process_csv(config['file_paths']['csv'], args.shard, args.shard_strategy)
+    finally:
+        processor.close()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -8,16 +8,24 @@ from src.file_readers.powerpoint_reader import read_powerpoint
 from src.file_readers.text_reader import read_text
 from src.file_readers.zip_reader import read_zip
 from src.file_readers.csv_reader import read_csv
-from src.utils.error_handler import send_error_notification
+from src.utils.error_handler import NotificationDispatcher
+from src.utils.sharding import partition_paths, read_file_sizes
 
 class FileProcessor:
-    def __init__(self, keyword_A_list, keyword_B_list, webhook_url, error_threshold):
+    def __init__(self, keyword_A_list, keyword_B_list, webhook_url, error_threshold,
+                 flush_interval=5.0, max_queue_size=1000, max_retries=3, close_timeout=30.0,
+                 show_progress=True):
         self.keyword_A_list = keyword_A_list
         self.keyword_B_list = keyword_B_list
         self.webhook_url = webhook_url
         self.error_threshold = error_threshold
-        self.error_buffer = []
+        self.show_progress = show_progress
         self.logger = logging.getLogger(__name__)
+        # Webhook への送信はバックグラウンドで行い、ワーカースレッドを止めない
+        self.notifier = NotificationDispatcher(
+            webhook_url, error_threshold, flush_interval, max_queue_size, max_retries,
+            close_timeout=close_timeout
+        ) if webhook_url else None
 
     def process_file(self, file_path):
         try:
@@ -89,12 +97,15 @@ class FileProcessor:
 
     def handle_error(self, error_message):
         self.logger.error(error_message)
-        self.error_buffer.append(error_message)
-        if len(self.error_buffer) >= self.error_threshold:
-            send_error_notification(self.webhook_url, self.error_buffer)
-            self.error_buffer.clear()
+        if self.notifier is not None:
+            self.notifier.notify(error_message)
 
-    def process_csv(self, csv_file_path):
+    def close(self):
+        # 未送信のエラー通知を送信してから終了する (close_timeout 秒を過ぎた分は破棄)
+        if self.notifier is not None:
+            self.notifier.close()
+
+    def process_csv(self, csv_file_path, shard=None, shard_strategy='size'):
         try:
             file_paths = read_csv(csv_file_path)
             
@@ -102,8 +113,15 @@ class FileProcessor:
                 self.logger.warning(f"No file paths found in CSV: {csv_file_path}")
                 return
 
+            # シャード指定がある場合は担当分のファイルのみ処理する
+            if shard is not None:
+                # 2列目にサイズがあればそれを使い、全シャードで同じ分割になるようにする
+                file_sizes = read_file_sizes(csv_file_path) if shard_strategy == 'size' else None
+                file_paths = partition_paths(file_paths, shard[0], shard[1], shard_strategy, file_sizes)
+                self.logger.info(f"Processing shard {shard[0]}/{shard[1]} ({shard_strategy}): {len(file_paths)} files")
+
             with ThreadPoolExecutor() as executor:
-                list(tqdm(executor.map(self.process_file, file_paths), total=len(file_paths)))
+                list(tqdm(executor.map(self.process_file, file_paths), total=len(file_paths), disable=not self.show_progress))
 
             self.logger.info(f"Completed processing of CSV: {csv_file_path}")
         except Exception as e:
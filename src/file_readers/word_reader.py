@@ -1,6 +1,5 @@
 import logging
 from docx import Document
-import win32com.client
 
 def read_word(file_path):
     try:
@@ -17,6 +16,9 @@ def read_docx(file_path):
     return "\n".join([paragraph.text for paragraph in doc.paragraphs])
 
 def read_doc(file_path):
+    # win32com は Windows 専用のため、.doc を読む時だけインポートする
+    import win32com.client
+
     word = win32com.client.Dispatch("Word.Application")
     doc = word.Documents.Open(file_path)
     text = doc.Content.Text
@@ -1,13 +1,195 @@
-import requests
 import logging
+import queue
+import threading
+import time
+import requests
+
+def send_error_notification(webhook_url, error_buffer, session=None, timeout=10):
+    """
+    エラーメッセージをまとめて Webhook に送信する関数
+
+    Args:
+        webhook_url (str): 送信先の Webhook URL
+        error_buffer (list): 送信するエラーメッセージのリスト
+        session (requests.Session): 接続を再利用するためのセッション (省略時は都度接続)
+        timeout (float): リクエストのタイムアウト秒数
 
-def send_error_notification(webhook_url, error_buffer):
+    Returns:
+        bool: 送信に成功した場合は True
+    """
     payload = {"errors": error_buffer}
     headers = {"Content-Type": "application/json"}
-    
+
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers, timeout=10)
+        response = (session or requests).post(webhook_url, json=payload, headers=headers, timeout=timeout)
         response.raise_for_status()
         logging.info(f"Sent {len(error_buffer)} notifications successfully.")
+        return True
     except requests.RequestException as e:
-        logging.error(f"Failed to send notifications: {e}")
\ No newline at end of file
+        logging.error(f"Failed to send notifications: {e}")
+        return False
+
+
+class NotificationDispatcher:
+    """
+    エラー通知をバックグラウンドスレッドからまとめて送信するクラス
+
+    notify() はキューに積むだけで、ワーカースレッドをブロックしない。
+    バックグラウンドスレッドは batch_size 件たまるか flush_interval 秒経過した時点で
+    送信し、失敗した場合は指数バックオフで再試行する。close() で残りを送信するが、
+    終了処理中は再試行せず、close_timeout 秒を過ぎた分は破棄してログに残す。
+    """
+
+    _STOP = object()
+
+    def __init__(self, webhook_url, batch_size, flush_interval=5.0, max_queue_size=1000,
+                 max_retries=3, backoff_base=1.0, session=None, close_timeout=30.0,
+                 request_timeout=10):
+        self.webhook_url = webhook_url
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.close_timeout = close_timeout
+        self.request_timeout = request_timeout
+        self.session = session or requests.Session()
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self._closed = False
+        self._closing = threading.Event()
+        self._deadline = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='NotificationDispatcher', daemon=True)
+        self._thread.start()
+
+    def notify(self, error_message):
+        """
+        エラーメッセージを送信キューに追加する
+
+        Args:
+            error_message (str): 送信するエラーメッセージ
+
+        Returns:
+            bool: キューに追加できた場合は True。キューが満杯、または close() 後は False
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            try:
+                self.queue.put_nowait(error_message)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                logging.warning(f"Notification queue is full; dropped error notification ({self.dropped} dropped so far)")
+                return False
+
+    def close(self, timeout=None):
+        """
+        キューに残っている通知を送信してからスレッドを停止する
+
+        Args:
+            timeout (float): 残りの通知の送信にかける最大秒数 (省略時は close_timeout)
+
+        Returns:
+            bool: 時間内にスレッドが終了した場合は True
+        """
+        with self._lock:
+            if self._closed:
+                return self.join(0)
+            self._closed = True
+        if timeout is None:
+            timeout = self.close_timeout
+        self._deadline = time.monotonic() + timeout
+        # バックオフ待ちを中断し、以降は再試行しない
+        self._closing.set()
+        try:
+            self.queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            # ワーカーはキューが空になった時点で終了する
+            pass
+        if not self.join(max(self._deadline - time.monotonic(), 0)):
+            logging.warning("Notification dispatcher did not finish within the shutdown timeout; remaining notifications are lost")
+            return False
+        return True
+
+    def join(self, timeout=None):
+        """
+        送信スレッドの終了を待つ
+
+        Args:
+            timeout (float): 待機する最大秒数 (省略時は終了まで待つ)
+
+        Returns:
+            bool: スレッドが終了している場合は True
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        # 送信中のリクエストがあるうちにセッションを閉じないよう、終了時にスレッド自身が閉じる
+        try:
+            self._process_queue()
+        finally:
+            self.session.close()
+
+    def _process_queue(self):
+        batch = []
+        deadline = None
+        while True:
+            if self._closing.is_set():
+                # 終了処理中はキューに残っている分だけを処理する
+                remaining = 0
+            else:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self.queue.get(timeout=remaining) if remaining != 0 else self.queue.get_nowait()
+            except queue.Empty:
+                self._send_with_retry(batch)
+                batch = []
+                deadline = None
+                if self._closing.is_set():
+                    return
+                continue
+
+            if item is self._STOP:
+                self._send_with_retry(batch)
+                return
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._send_with_retry(batch)
+                batch = []
+                deadline = None
+
+    def _send_with_retry(self, batch):
+        if not batch:
+            return
+        attempt = 0
+        while True:
+            if self._closing.is_set():
+                # 終了処理中は残り時間の範囲で1回だけ送信する
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    self._drop(batch, "shutdown timeout exceeded")
+                    return
+                if not send_error_notification(self.webhook_url, batch, session=self.session,
+                                               timeout=min(self.request_timeout, remaining)):
+                    self._drop(batch, "send failed during shutdown")
+                return
+
+            if send_error_notification(self.webhook_url, batch, session=self.session,
+                                       timeout=self.request_timeout):
+                return
+            if attempt >= self.max_retries:
+                self._drop(batch, f"giving up after {attempt + 1} attempts")
+                return
+            # close() が呼ばれたら待機を打ち切る
+            self._closing.wait(self.backoff_base * (2 ** attempt))
+            attempt += 1
+
+    def _drop(self, batch, reason):
+        with self._lock:
+            self.dropped += len(batch)
+        logging.error(f"Dropped {len(batch)} notifications ({reason})")
@@ -7,7 +7,7 @@ class CSVResultHandler(logging.Handler):
     def __init__(self, filename):
         super().__init__()
         self.filename = filename
-        self.csv_file = open(self.filename, 'w', newline='')
+        self.csv_file = open(self.filename, 'w', newline='', encoding='utf-8-sig')
         self.csv_writer = csv.writer(self.csv_file)
         self.csv_writer.writerow(['Timestamp', 'File Path', 'Status', 'Matched Keywords', 'Error Message'])
 
@@ -0,0 +1,160 @@
+import csv
+import hashlib
+import logging
+import os
+
+SHARD_STRATEGIES = ('size', 'hash', 'range')
+
+RESULT_HEADER = ['Timestamp', 'File Path', 'Status', 'Matched Keywords', 'Error Message']
+
+def parse_shard(shard_spec):
+    """
+    "i/N" 形式のシャード指定を解析する関数
+
+    Args:
+        shard_spec (str): シャード指定 (例: "2/4"。i は 1 始まり)
+
+    Returns:
+        tuple: (シャード番号 i, シャード数 N)
+    """
+    try:
+        index, count = (int(value) for value in shard_spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard specification '{shard_spec}': expected i/N") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard specification '{shard_spec}': i must be between 1 and N")
+    return index, count
+
+def _file_size(file_path):
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        # 存在しないファイルも処理対象として残し、エラーは処理時に記録する
+        logging.warning(f"Cannot stat {file_path}; treating its size as 0. "
+                        "Shards that see a different size will split the list differently")
+        return 0
+
+def read_file_sizes(csv_file_path):
+    """
+    入力 CSV の2列目からファイルサイズを読み込む関数
+
+    全シャードが同じサイズで分割できるよう、サイズを事前に CSV に書いておくために使う。
+    サイズ列があるのに一部の行でサイズが欠けている場合は、その件数を警告する
+    (該当ファイルは partition_paths でサイズ 0 として扱われる)。
+
+    Args:
+        csv_file_path (str): 入力 CSV のパス (1列目: ファイルパス, 2列目: バイト数)
+
+    Returns:
+        dict: ファイルパスをキー、サイズを値とする辞書。サイズ列がない場合は None
+    """
+    sizes = {}
+    without_size = []
+    try:
+        with open(csv_file_path, newline='', encoding='utf-8') as csvfile:
+            for line_number, row in enumerate(csv.reader(csvfile)):
+                if not row:
+                    continue
+                if len(row) >= 2 and row[1].strip().isdigit():
+                    sizes[row[0]] = int(row[1])
+                elif line_number > 0:
+                    # 1行目はヘッダーの可能性があるため数えない
+                    without_size.append(row[0])
+    except Exception as e:
+        logging.error(f"Error reading file sizes from CSV {csv_file_path}: {e}")
+    if sizes and without_size:
+        logging.warning(f"{len(without_size)} of {len(sizes) + len(without_size)} rows in {csv_file_path} "
+                        f"have no size in the second column; they are treated as size 0 "
+                        f"(first: {without_size[0]})")
+    return sizes or None
+
+def partition_paths(file_paths, shard_index, shard_count, strategy='size', file_sizes=None):
+    """
+    ファイルパスのリストを決定的に分割し、指定シャードの担当分を返す関数
+
+    どのホストで実行しても同じ入力なら同じ分割になる。重複したパスは最初の1件のみ扱う。
+    "size" で file_sizes を省略した場合は各ホストでファイルサイズを取得するため、
+    全シャードから同じファイルが同じサイズで見えている必要がある。見え方が異なると
+    分割がずれ、処理漏れや重複が起きる。確実に揃えるには file_sizes を渡すこと。
+
+    Args:
+        file_paths (list): ファイルパスのリスト
+        shard_index (int): シャード番号 (1 始まり)
+        shard_count (int): シャード数
+        strategy (str): 分割方法
+            - "size": ファイルサイズの合計が均等になるように割り当てる
+            - "hash": パスのハッシュ値で割り当てる
+            - "range": 件数で連続した範囲に分ける
+        file_sizes (dict): ファイルパスをキー、サイズを値とする辞書 (含まれないパスは 0 とみなす)
+
+    Returns:
+        list: 指定シャードが担当するファイルパス (元の順序を維持)
+    """
+    if strategy not in SHARD_STRATEGIES:
+        raise ValueError(f"Unknown shard strategy: {strategy}")
+    paths = list(dict.fromkeys(file_paths))
+    target = shard_index - 1
+
+    if strategy == 'range':
+        start = len(paths) * target // shard_count
+        end = len(paths) * (target + 1) // shard_count
+        return paths[start:end]
+
+    if strategy == 'hash':
+        return [
+            path for path in paths
+            if int(hashlib.sha1(path.encode('utf-8')).hexdigest(), 16) % shard_count == target
+        ]
+
+    # 大きいファイルから順に、合計サイズが最も小さいシャードへ割り当てる (LPT法)
+    totals = [0] * shard_count
+    assigned = set()
+    if file_sizes is not None:
+        sizes = [(file_sizes.get(path, 0), path) for path in paths]
+    else:
+        sizes = [(_file_size(path), path) for path in paths]
+    for size, path in sorted(sizes, key=lambda item: (-item[0], item[1])):
+        shard = min(range(shard_count), key=lambda i: (totals[i], i))
+        totals[shard] += size
+        if shard == target:
+            assigned.add(path)
+    logging.info(f"Shard {shard_index}/{shard_count}: {len(assigned)} files, {totals[target]} bytes")
+    return [path for path in paths if path in assigned]
+
+def merge_results(result_csv_paths, output_path, file_paths=None):
+    """
+    シャードごとの結果 CSV を1つのレポートにまとめる関数
+
+    同じファイルの結果が複数ある場合は、タイムスタンプが最も新しいものを残す。
+    file_paths を指定した場合、結果のないファイルは missing として返す。
+
+    Args:
+        result_csv_paths (list): シャードごとの結果 CSV のパス
+        output_path (str): まとめた結果の出力先
+        file_paths (list): 元の入力ファイルリスト。指定した場合はこの順序で並べる
+            (リストにないファイルは末尾にパス順で並べる)
+
+    Returns:
+        tuple: (出力した行数, 結果のないファイルパスのリスト)
+    """
+    latest = {}
+    for result_csv_path in result_csv_paths:
+        with open(result_csv_path, newline='', encoding='utf-8-sig') as csvfile:
+            for row in csv.DictReader(csvfile):
+                file_path = row['File Path']
+                if file_path not in latest or row['Timestamp'] >= latest[file_path]['Timestamp']:
+                    latest[file_path] = row
+
+    order = {path: position for position, path in enumerate(dict.fromkeys(file_paths or []))}
+    rows = sorted(latest.values(), key=lambda row: (
+        order.get(row['File Path'], len(order)), row['File Path']
+    ))
+
+    # Excel で日本語のパスが文字化けしないよう BOM 付きで書き出す (CSVResultHandler と同じ)
+    with open(output_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=RESULT_HEADER, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    missing = [path for path in order if path not in latest]
+    return len(rows), missing
@@ -0,0 +1,54 @@
+import os
+import zipfile
+import pytest
+from benchmarks.corpus_generator import FIXED_ZIP_DATE, generate_corpus, validate_keywords
+from src.file_readers.text_reader import read_text
+from src.file_readers.xlsb_reader import read_xlsb
+
+def test_generate_corpus_is_deterministic(tmp_path):
+    # 既定の形式とZIPメンバー (docx を含む) で、すべてのファイルがバイト単位で一致する
+    first = generate_corpus(str(tmp_path / 'a'), files_per_format=2, size_kb=4, keyword_density=0.01, seed=42)
+    second = generate_corpus(str(tmp_path / 'b'), files_per_format=2, size_kb=4, keyword_density=0.01, seed=42)
+    assert len(first) == len(second) > 0
+    for entry_a, entry_b in zip(first, second):
+        assert entry_a['keywords'] == entry_b['keywords']
+        with open(entry_a['path'], 'rb') as file_a, open(entry_b['path'], 'rb') as file_b:
+            assert file_a.read() == file_b.read()
+
+def test_generate_corpus_keyword_density(tmp_path):
+    manifest = generate_corpus(str(tmp_path), formats=('txt',), files_per_format=1,
+                               size_kb=4, keyword_density=0.0, keywords=['needle'])
+    assert manifest[0]['keywords'] == []
+    assert 'needle' not in read_text(manifest[0]['path'])
+
+    manifest = generate_corpus(str(tmp_path), formats=('txt',), files_per_format=1,
+                               size_kb=4, keyword_density=1.0, keywords=['needle'])
+    assert manifest[0]['keywords'] == ['needle']
+    assert set(read_text(manifest[0]['path']).split()) == {'needle'}
+
+def test_generated_xlsb_is_readable(tmp_path):
+    manifest = generate_corpus(str(tmp_path), formats=('xlsb',), files_per_format=1,
+                               size_kb=4, keyword_density=0.05, keywords=['needle'])
+    content = read_xlsb(manifest[0]['path'])
+    assert 'needle' in content
+    assert len(content) > 0
+
+def test_generate_corpus_writes_file_list(tmp_path):
+    manifest = generate_corpus(str(tmp_path), formats=('txt', 'zip'), files_per_format=1,
+                               size_kb=1, zip_member_formats=('txt',))
+    with open(os.path.join(str(tmp_path), 'file_list.csv'), encoding='utf-8') as file:
+        assert file.read().split() == [entry['path'] for entry in manifest]
+    with zipfile.ZipFile(manifest[1]['path']) as zip_ref:
+        assert zip_ref.namelist() == ['member_0000.txt']
+
+def test_generated_ooxml_has_fixed_dates(tmp_path):
+    manifest = generate_corpus(str(tmp_path), formats=('docx',), files_per_format=1, size_kb=1)
+    with zipfile.ZipFile(manifest[0]['path']) as zip_ref:
+        assert {info.date_time for info in zip_ref.infolist()} == {FIXED_ZIP_DATE}
+
+def test_validate_keywords_rejects_overlaps():
+    validate_keywords(['keyword1', 'needle'])
+    # 語彙の単語・リーダーの出力・他のキーワードと部分一致するキーワードは件数が合わなくなる
+    for invalid in [['port'], ['Sheet'], ['key', 'keyword1'], ['two words'], ['']]:
+        with pytest.raises(ValueError):
+            validate_keywords(invalid)
@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from src.utils.error_handler import NotificationDispatcher, send_error_notification
+
+class WebhookStub(ThreadingHTTPServer):
+    """受信したペイロードを記録するローカルの Webhook"""
+
+    daemon_threads = True
+
+    def __init__(self, fail_count=0):
+        super().__init__(('127.0.0.1', 0), WebhookHandler)
+        self.fail_count = fail_count
+        self.requests = []
+        self.batches = []
+        self.client_ports = []
+        # clear() するとリクエストへの応答を止める
+        self.responding = threading.Event()
+        self.responding.set()
+        self.received = threading.Event()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/webhook"
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    # keep-alive で接続が再利用されているかを確認できるようにする
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(body)
+        self.server.client_ports.append(self.client_address[1])
+        self.server.received.set()
+        self.server.responding.wait()
+        if self.server.fail_count > 0:
+            self.server.fail_count -= 1
+            self.send_response(500)
+        else:
+            self.server.batches.append(json.loads(body)['errors'])
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+class TrackingSession(requests.Session):
+    """close() が呼ばれたかを記録するセッション"""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+@pytest.fixture
+def webhook():
+    server = WebhookStub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.responding.set()
+    server.shutdown()
+    server.server_close()
+
+def test_send_error_notification(webhook):
+    assert send_error_notification(webhook.url, ["error"])
+    assert webhook.batches == [["error"]]
+
+def test_dispatcher_batches_by_size(webhook):
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=2, flush_interval=60)
+    for i in range(4):
+        dispatcher.notify(f"error {i}")
+    dispatcher.close()
+    assert webhook.batches == [["error 0", "error 1"], ["error 2", "error 3"]]
+
+def test_dispatcher_flushes_after_interval(webhook):
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=100, flush_interval=0.1)
+    dispatcher.notify("error")
+    deadline = time.monotonic() + 5
+    while not webhook.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert webhook.batches == [["error"]]
+    dispatcher.close()
+
+def test_dispatcher_retries_failed_batches(webhook):
+    webhook.fail_count = 2
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=1, max_retries=3, backoff_base=0.01)
+    dispatcher.notify("error")
+    deadline = time.monotonic() + 5
+    while not webhook.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    dispatcher.close()
+    assert len(webhook.requests) == 3
+    assert webhook.batches == [["error"]]
+
+def test_dispatcher_drains_queue_on_close(webhook):
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=10, flush_interval=60)
+    for i in range(25):
+        dispatcher.notify(f"error {i}")
+    dispatcher.close()
+    assert [error for batch in webhook.batches for error in batch] == [f"error {i}" for i in range(25)]
+    assert not dispatcher.notify("late error")
+
+def test_dispatcher_is_thread_safe(webhook):
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=7, flush_interval=60, max_queue_size=10000)
+    threads = [
+        threading.Thread(target=lambda n=n: [dispatcher.notify(f"{n}-{i}") for i in range(50)])
+        for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dispatcher.close()
+    received = [error for batch in webhook.batches for error in batch]
+    assert sorted(received) == sorted(f"{n}-{i}" for n in range(8) for i in range(50))
+
+def test_dispatcher_reuses_connection(webhook):
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=1, flush_interval=60)
+    for i in range(3):
+        dispatcher.notify(f"error {i}")
+    dispatcher.close()
+    assert len(webhook.batches) == 3
+    assert len(set(webhook.client_ports)) == 1
+
+def test_dispatcher_drops_when_queue_is_full(webhook):
+    webhook.responding.clear()
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=1, max_queue_size=2)
+    assert dispatcher.notify("error 0")
+    # 1件目の送信でワーカーが止まるのを待ってからキューを埋める
+    assert webhook.received.wait(5)
+    assert dispatcher.notify("error 1")
+    assert dispatcher.notify("error 2")
+    assert not dispatcher.notify("error 3")
+    assert dispatcher.dropped == 1
+    webhook.responding.set()
+    dispatcher.close()
+    assert [error for batch in webhook.batches for error in batch] == ["error 0", "error 1", "error 2"]
+
+def test_dispatcher_close_gives_up_after_timeout(webhook):
+    webhook.responding.clear()
+    session = TrackingSession()
+    request_timeout = 30
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=1, max_queue_size=100,
+                                        session=session, request_timeout=request_timeout)
+    for i in range(30):
+        dispatcher.notify(f"error {i}")
+    assert webhook.received.wait(5)
+    start = time.monotonic()
+    assert not dispatcher.close(timeout=0.5)
+    # 送信中のリクエストのタイムアウトまでは待たない
+    assert time.monotonic() - start < request_timeout / 2
+    # 送信中のセッションは閉じず、スレッドの終了時に閉じる
+    assert not session.closed
+    webhook.responding.set()
+    assert dispatcher.join(10)
+    assert session.closed
+    # 送信中だった1件目以外は破棄される
+    assert dispatcher.dropped == 29
+    assert webhook.batches == [["error 0"]]
+
+def test_dispatcher_close_interrupts_backoff(webhook):
+    webhook.fail_count = 100
+    backoff_base = 30
+    dispatcher = NotificationDispatcher(webhook.url, batch_size=1, max_retries=5, backoff_base=backoff_base)
+    dispatcher.notify("error")
+    assert webhook.received.wait(5)
+    start = time.monotonic()
+    # バックオフ (30秒) の終了を待たずに終わる
+    assert dispatcher.close(timeout=backoff_base / 2)
+    assert time.monotonic() - start < backoff_base / 2
+    assert dispatcher.dropped == 1
@@ -1,6 +1,100 @@
-import unittest 
-class TestMain(unittest.TestCase): 
-    def test_main(self): 
-        self.assertTrue(True) 
-if __name__ == "__main__": 
-    unittest.main() 
+import csv
+import io
+import logging
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import main
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.file_base = os.path.join(self.temp_dir.name, "search_log")
+        self.file_paths = []
+        for i in range(4):
+            path = os.path.join(self.temp_dir.name, f"file{i}.txt")
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write("keyword1 keyword3" if i % 2 == 0 else "nothing")
+            self.file_paths.append(path)
+        self.csv_path = os.path.join(self.temp_dir.name, "files.csv")
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            csv.writer(csvfile).writerows([[path] for path in self.file_paths])
+
+        config = {
+            'keywords': {'A': ['keyword1'], 'B': ['keyword3']},
+            'file_paths': {'csv': self.csv_path},
+            'notifications': {'webhook_url': None, 'error_threshold': 10},
+            'logging': {'level': 'INFO', 'format': '%(message)s', 'file_base': self.file_base},
+        }
+        patcher = mock.patch.object(main, 'load_config', return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.original_handlers = list(logging.getLogger().handlers)
+        self.addCleanup(self.remove_log_handlers)
+
+    def remove_log_handlers(self):
+        # setup_logger がルートロガーに追加したハンドラを外し、ファイルを閉じる
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            if handler not in self.original_handlers:
+                root.removeHandler(handler)
+                handler.close()
+
+    def run_main(self, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = main.main(argv)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def run_shard(self, index, count):
+        status = main.main(['--shard', f'{index}/{count}', '--shard-strategy', 'range'])
+        self.remove_log_handlers()
+        return status
+
+    def read_result_paths(self, path):
+        with open(path, newline='', encoding='utf-8-sig') as csvfile:
+            return [row['File Path'] for row in csv.DictReader(csvfile)]
+
+    def test_invalid_shard_is_an_argument_error(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+            main.main(['--shard', '3/2'])
+        self.assertEqual(context.exception.code, 2)
+        self.assertIn("Invalid shard specification '3/2'", stderr.getvalue())
+
+    def test_shard_writes_its_own_results(self):
+        self.assertEqual(self.run_shard(1, 2), 0)
+        shard_results = f"{self.file_base}_shard1of2_results.csv"
+        self.assertEqual(sorted(self.read_result_paths(shard_results)), self.file_paths[:2])
+        self.assertFalse(os.path.exists(f"{self.file_base}_results.csv"))
+
+    def test_merge_finds_shard_results(self):
+        self.assertEqual(self.run_shard(1, 2), 0)
+        self.assertEqual(self.run_shard(2, 2), 0)
+        status, stdout, stderr = self.run_main(['--merge'])
+        self.assertEqual(status, 0)
+        self.assertIn("Merged 2 result files into 4 rows", stdout)
+        self.assertEqual(stderr, "")
+        self.assertEqual(self.read_result_paths(f"{self.file_base}_results.csv"), self.file_paths)
+
+    def test_merge_reports_missing_files(self):
+        self.assertEqual(self.run_shard(1, 2), 0)
+        output = os.path.join(self.temp_dir.name, "merged.csv")
+        status, _, stderr = self.run_main(['--merge', '--merge-output', output])
+        self.assertEqual(status, 1)
+        self.assertIn("2 input files have no result", stderr)
+        for path in self.file_paths[2:]:
+            self.assertIn(path, stderr)
+        self.assertEqual(self.read_result_paths(output), self.file_paths[:2])
+
+    def test_merge_without_shard_results(self):
+        status, _, stderr = self.run_main(['--merge'])
+        self.assertEqual(status, 1)
+        self.assertIn("No shard result files found", stderr)
+
+if __name__ == "__main__":
+    unittest.main()
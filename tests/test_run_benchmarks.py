@@ -0,0 +1,49 @@
+from benchmarks.run_benchmarks import MEMORY_NOISE_BYTES, MIN_GATING_REPEAT, compare_with_baseline, exit_status
+
+PARAMS = {'files_per_format': 5, 'size_kb': 64}
+
+def make_results(seconds, spread=0.0, memory=1024 * 1024, memory_spread=0.0):
+    return {
+        'params': PARAMS,
+        'benchmarks': {
+            'matcher': {
+                'seconds': seconds,
+                'min_seconds': seconds,
+                'spread': spread,
+                'peak_memory_bytes': memory,
+                'memory_spread': memory_spread,
+            },
+        },
+    }
+
+def test_slowdown_within_spread_passes():
+    # 20% 遅いが、ばらつきの合計 (15% + 15%) の範囲内
+    baseline = make_results(1.0, spread=0.15)
+    results = make_results(1.2, spread=0.15)
+    assert compare_with_baseline(results, baseline, 0.1) == []
+
+def test_slowdown_beyond_spread_and_tolerance_is_reported():
+    baseline = make_results(1.0, spread=0.05)
+    results = make_results(1.5, spread=0.05)
+    assert compare_with_baseline(results, baseline, 0.1) == ['matcher']
+
+def test_small_memory_increase_is_ignored():
+    # 率では tolerance を超えても、MEMORY_NOISE_BYTES 未満の増加は無視する
+    baseline = make_results(1.0, memory=100 * 1024)
+    results = make_results(1.0, memory=100 * 1024 + MEMORY_NOISE_BYTES - 1)
+    assert compare_with_baseline(results, baseline, 0.1) == []
+
+    results = make_results(1.0, memory=100 * 1024 + MEMORY_NOISE_BYTES * 2)
+    assert compare_with_baseline(results, baseline, 0.1) == ['matcher']
+
+def test_baseline_without_min_seconds_uses_seconds():
+    # min_seconds を記録する前の古いベースライン
+    baseline = make_results(1.0)
+    del baseline['benchmarks']['matcher']['min_seconds']
+    assert compare_with_baseline(make_results(1.05), baseline, 0.1) == []
+    assert compare_with_baseline(make_results(1.5), baseline, 0.1) == ['matcher']
+
+def test_few_repeats_do_not_fail_the_run():
+    assert exit_status([], MIN_GATING_REPEAT) == 0
+    assert exit_status(['matcher'], MIN_GATING_REPEAT) == 1
+    assert exit_status(['matcher'], MIN_GATING_REPEAT - 1) == 0
@@ -0,0 +1,98 @@
+import csv
+import logging
+import os
+import pytest
+from src.utils.sharding import merge_results, parse_shard, partition_paths, read_file_sizes, RESULT_HEADER
+
+def write_file(directory, name, size):
+    path = os.path.join(str(directory), name)
+    with open(path, 'wb') as file:
+        file.write(b'x' * size)
+    return path
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for invalid in ["0/4", "5/4", "1/0", "1", "a/b"]:
+        with pytest.raises(ValueError):
+            parse_shard(invalid)
+
+@pytest.mark.parametrize("strategy", ["size", "hash", "range"])
+def test_partition_covers_every_path_once(tmp_path, strategy):
+    paths = [write_file(tmp_path, f"file{i}.txt", i * 10) for i in range(20)]
+    shards = [partition_paths(paths, i, 3, strategy) for i in range(1, 4)]
+    assert sorted(path for shard in shards for path in shard) == sorted(paths)
+    for shard in shards:
+        assert shard == [path for path in paths if path in shard]
+    assert shards == [partition_paths(paths, i, 3, strategy) for i in range(1, 4)]
+
+def test_partition_by_size_balances_bytes(tmp_path):
+    # 大きいファイルが先頭に固まっていても、サイズの合計で均等に分かれる
+    paths = [write_file(tmp_path, f"big{i}.xlsx", 1000) for i in range(4)]
+    paths += [write_file(tmp_path, f"small{i}.txt", 10) for i in range(100)]
+    totals = [
+        sum(os.path.getsize(path) for path in partition_paths(paths, i, 4, 'size'))
+        for i in range(1, 5)
+    ]
+    assert max(totals) - min(totals) <= 10
+
+def test_partition_by_size_uses_given_sizes(tmp_path):
+    # サイズを渡した場合はファイルの有無やホストごとの見え方に左右されない
+    paths = [os.path.join(str(tmp_path), f"file{i}.txt") for i in range(10)]
+    sizes = {path: (i + 1) * 100 for i, path in enumerate(paths)}
+    shards = [partition_paths(paths, i, 2, 'size', sizes) for i in range(1, 3)]
+    assert sorted(path for shard in shards for path in shard) == sorted(paths)
+    assert [sum(sizes[path] for path in shard) for shard in shards] == [2800, 2700]
+
+def test_read_file_sizes(tmp_path):
+    csv_path = os.path.join(str(tmp_path), "files.csv")
+    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        csv.writer(csvfile).writerows([["file_path", "size"], ["a.txt", "10"], ["b.txt", "20"]])
+    assert read_file_sizes(csv_path) == {"a.txt": 10, "b.txt": 20}
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        csv.writer(csvfile).writerows([["a.txt"], ["b.txt"]])
+    assert read_file_sizes(csv_path) is None
+
+def test_read_file_sizes_warns_about_missing_sizes(tmp_path, caplog):
+    csv_path = os.path.join(str(tmp_path), "files.csv")
+    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        csv.writer(csvfile).writerows([
+            ["file_path", "size"], ["a.txt", "10"], ["b.txt"], ["c.txt", ""], ["d.txt", "40"]
+        ])
+    with caplog.at_level(logging.WARNING):
+        assert read_file_sizes(csv_path) == {"a.txt": 10, "d.txt": 40}
+    assert "2 of 4 rows" in caplog.text
+    assert "b.txt" in caplog.text
+
+def test_partition_ignores_duplicates_and_missing_files(tmp_path):
+    missing = os.path.join(str(tmp_path), "missing.txt")
+    paths = [missing, missing]
+    shards = [partition_paths(paths, i, 2) for i in range(1, 3)]
+    assert sorted(shards) == [[], [missing]]
+
+def test_merge_results(tmp_path):
+    def write_results(name, rows):
+        path = os.path.join(str(tmp_path), name)
+        with open(path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(RESULT_HEADER)
+            writer.writerows(rows)
+        return path
+
+    shard1 = write_results("shard1.csv", [
+        ["2024-01-01T00:00:02", "b.txt", "Matched", "keyword1", ""],
+        ["2024-01-01T00:00:01", "c.txt", "Error", "", "boom"],
+    ])
+    shard2 = write_results("shard2.csv", [
+        ["2024-01-01T00:00:01", "a.txt", "Not Matched", "None", ""],
+        ["2024-01-01T00:00:03", "c.txt", "Matched", "keyword3", ""],
+    ])
+    output = os.path.join(str(tmp_path), "merged.csv")
+
+    assert merge_results([shard1, shard2], output, ["c.txt", "a.txt", "b.txt", "d.txt"]) == (3, ["d.txt"])
+    with open(output, newline='', encoding='utf-8-sig') as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert rows[0] == RESULT_HEADER
+    assert [(row[1], row[2]) for row in rows[1:]] == [
+        ("c.txt", "Matched"), ("a.txt", "Not Matched"), ("b.txt", "Matched")
+    ]